@@ -1,7 +1,13 @@
 """Utilities for fetching active proxies from PROXY6.net."""
 
 from .core import fetch_proxies
+from .core import fetch_proxies_from_payload
 from .core import format_env_exports
 from .core import write_proxies
 
-__all__ = ["fetch_proxies", "write_proxies", "format_env_exports"]
+__all__ = [
+    "fetch_proxies",
+    "fetch_proxies_from_payload",
+    "write_proxies",
+    "format_env_exports",
+]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import logging
 import os
 import sys
@@ -10,10 +11,13 @@ import sys
 from pathlib import Path
 
 from .core import Px6ProxyFetcherError
+from .core import default_cache_dir
 from .core import fetch_proxies
 from .core import format_env_exports
 from .core import write_proxies
 
+logger = logging.getLogger(__name__)
+
 
 def main(argv: list[str] | None = None) -> int:
     """Main entry point for the px6-proxy-fetcher CLI.
@@ -30,6 +34,9 @@ def main(argv: list[str] | None = None) -> int:
     configure_logging(args)
     load_dotenv_if_available()
 
+    if args.api_keys_file:
+        return run_batch(args, parser)
+
     api_key = args.api_key or os.getenv("PX6_API_KEY")
     if not api_key:
         msg = (
@@ -39,9 +46,12 @@ def main(argv: list[str] | None = None) -> int:
         parser.error(msg)
 
     try:
-        proxies = fetch_proxies(api_key, timeout=args.timeout)
+        proxies = fetch_proxies(
+            api_key,
+            timeout=args.timeout,
+            cache_dir=default_cache_dir() if args.cache else None,
+        )
     except Px6ProxyFetcherError as exc:
-        logger = logging.getLogger(__name__)
         logger.error("Failed to fetch proxies: %s", exc)
         return 1
 
@@ -53,12 +63,94 @@ def main(argv: list[str] | None = None) -> int:
         print(format_env_exports(proxies))
 
     if not proxies:
-        logger = logging.getLogger(__name__)
         logger.warning("No active proxies returned by the API.")
 
     return 0
 
 
+def run_batch(
+    args: argparse.Namespace,
+    parser: argparse.ArgumentParser
+) -> int:
+    """Fetch proxies for every key in --api-keys-file concurrently.
+
+    Each key's proxies are written to --output with any "{key}"
+    placeholder replaced by a short hash of that key, so keys never end
+    up in file names or logs. Keys that fail are logged and skipped;
+    the others are still written.
+
+    Args:
+        args: Parsed command-line arguments.
+        parser: Argument parser, used to report usage errors.
+
+    Returns:
+        Exit code: 0 for success, 1 if any key failed.
+    """
+    if args.api_key:
+        parser.error("--api-key cannot be combined with --api-keys-file.")
+    if args.cache:
+        parser.error("--cache cannot be combined with --api-keys-file.")
+
+    try:
+        from .core_async import fetch_proxies_many_sync
+    except ImportError:
+        parser.error(
+            "--api-keys-file requires aiohttp "
+            "(pip install px6-proxy-fetcher[async])."
+        )
+
+    keys_path = Path(args.api_keys_file)
+    try:
+        lines = keys_path.read_text(encoding="utf-8").splitlines()
+    except OSError as exc:
+        parser.error(f"Cannot read {keys_path}: {exc}")
+
+    api_keys = [
+        line.strip()
+        for line in lines
+        if line.strip() and not line.lstrip().startswith("#")
+    ]
+    if not api_keys:
+        parser.error(f"No API keys found in {keys_path}.")
+
+    if len(api_keys) > 1 and "{key}" not in args.output:
+        parser.error(
+            "--output must contain a {key} placeholder when fetching "
+            "several API keys."
+        )
+
+    results = fetch_proxies_many_sync(
+        api_keys,
+        concurrency=args.parallel,
+        timeout=args.timeout,
+        return_exceptions=True,
+    )
+
+    failed = False
+    all_proxies = []
+    for api_key, proxies in results.items():
+        destination = Path(args.output.replace("{key}", key_label(api_key)))
+
+        if isinstance(proxies, Px6ProxyFetcherError):
+            logger.error(
+                "Failed to fetch proxies for %s: %s", destination, proxies
+            )
+            failed = True
+            continue
+
+        write_proxies(proxies, destination)
+        all_proxies.extend(proxies)
+
+        if not proxies:
+            logger.warning("No active proxies returned for %s.", destination)
+
+    if args.print_env and all_proxies:
+        print()
+        print(format_env_exports(all_proxies))
+
+    return 1 if failed else 0
+
+
 def build_parser() -> argparse.ArgumentParser:
     """Build the argument parser for the CLI.
 
@@ -76,13 +168,30 @@ def build_parser() -> argparse.ArgumentParser:
         "--api-key",
         help="PX6 API key (defaults to PX6_API_KEY env var)"
     )
+    parser.add_argument(
+        "--api-keys-file",
+        help=(
+            "File with one PX6 API key per line; fetches all of them "
+            "concurrently (requires the async extra)"
+        ),
+    )
     parser.add_argument(
         "--output",
         "-o",
         default="proxies.txt",
         help=(
             "Destination file for the proxy list "
-            "(default: proxies.txt)"
+            "(default: proxies.txt); with --api-keys-file, {key} is "
+            "replaced by a short hash of each API key"
+        ),
+    )
+    parser.add_argument(
+        "--parallel",
+        type=positive_int,
+        default=8,
+        help=(
+            "Maximum concurrent API requests with --api-keys-file "
+            "(default: 8)"
         ),
     )
     parser.add_argument(
@@ -101,6 +210,14 @@ def build_parser() -> argparse.ArgumentParser:
             "HTTP timeout for API requests in seconds (default: 30)"
         ),
     )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=(
+            "Cache the proxy list and only re-download it when the API "
+            "reports a change."
+        ),
+    )
     verbosity = parser.add_mutually_exclusive_group()
     verbosity.add_argument(
         "--quiet",
@@ -117,6 +234,42 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def positive_int(value: str) -> int:
+    """Parse a command-line value as an integer of at least 1.
+
+    Args:
+        value: Raw command-line value.
+
+    Returns:
+        The parsed integer.
+
+    Raises:
+        argparse.ArgumentTypeError: If value is not a positive integer.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+
+    if number < 1:
+        msg = f"expected a positive integer, got {value!r}"
+        raise argparse.ArgumentTypeError(msg)
+
+    return number
+
+
+def key_label(api_key: str) -> str:
+    """Return a short, stable label for api_key that does not reveal it.
+
+    Args:
+        api_key: PROXY6.net personal API key.
+
+    Returns:
+        First 12 hex digits of the key's SHA-256 digest.
+    """
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:12]
+
+
 def configure_logging(args: argparse.Namespace) -> None:
     """Configure logging based on command-line arguments.
 